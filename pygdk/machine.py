@@ -1,13 +1,63 @@
 import json
 import math
+import mmap
 import os
 import argparse
 import sys
+from functools import lru_cache
+from pathlib import Path
 script = sys.argv[0]
 
 from .tool import Tool
 from .turtle import Turtle
 
+# orjson decodes measurably faster than stdlib json and returns the same
+# dict/list structures; fall back to json.loads when it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    def _loads(buf):
+        # stdlib json can't parse a raw buffer (e.g. an mmap) directly
+        return json.loads(buf if isinstance(buf, (bytes, str)) else bytes(buf))
+
+# Files below this size aren't worth a mapping; read them outright
+_MMAP_THRESHOLD = 16384
+
+# Data directories, built once; also the single place to point elsewhere
+# if the tables ever move into a package resource
+_MACHINES_DIR = Path('machines')
+_TABLES_DIR = Path('tables')
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path_str, mtime):
+    with open(path_str, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            # Map larger tables and parse straight out of the mapping,
+            # skipping the stdio buffer copy; prefault the pages first
+            # where the platform supports madvise
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    mm.madvise(mmap.MADV_WILLNEED)
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    return _loads(view)
+        return _loads(f.read())
+
+
+def _load_json(path):
+    """
+    Parse a JSON config/table file, memoized on (path, mtime).
+
+    Machine construction and feeds-and-speeds updates hit the same few
+    files over and over; keying the cache on the file's mtime means
+    steady-state calls cost one stat() instead of a read and parse,
+    while edits on disk are still picked up.
+    """
+    path_str = os.fspath(path)
+    return _load_json_cached(path_str, os.stat(path_str).st_mtime_ns)
+
 
 BLACK  = '\033[30m'
 RED    = '\033[31m'
@@ -36,34 +86,34 @@ class Machine:
     def __init__(self, json_file):
         if not json_file:
             raise ValueError(f"{RED}All machines must be initialized with a JSON config.  See https://github.com/cilynx/pygdk#quickstart for a quick introduction.")
-        with open(f"machines/{json_file}") as f:
-            self.dict = json.load(f)
-            for req in ['Name', 'Max Feed Rate (mm/min)']:
-                if not self.dict.get(req, None):
-                    raise ValueError(f"{RED}All machines must have '{req}' defined in their JSON config.  See https://github.com/cilynx/pygdk/tree/main/machines for example configurations.")
-            self.name = self.dict['Name']
-            self.command_queue = [{'comment': f"Initializing Machine {self.name}", 'style': 'machine'}]
-            self.max_feed = self.dict['Max Feed Rate (mm/min)']
-            self._x_offset = 0
-            self._y_offset = 0
-            self._z_offset = 0
-            self._tool = None
-            self._absolute = None
-            self._feed = None
-            self._css = 0
-            self._turtle = None
-            self._optimize = False
-            self._x = None
-            self._y = None
-            self._z = None
-            self._linear_moves = {None:[]}
-            self._optimize_tool = None
-            self._material = None
-            self._x_clear = None
-            self._y_clear = None
-            self._z_clear = None
-            self._fan_speed = None
-            self.gcode = None
+        self.dict = _load_json(_MACHINES_DIR / json_file)
+        for req in ['Name', 'Max Feed Rate (mm/min)']:
+            if not self.dict.get(req, None):
+                raise ValueError(f"{RED}All machines must have '{req}' defined in their JSON config.  See https://github.com/cilynx/pygdk/tree/main/machines for example configurations.")
+        self.name = self.dict['Name']
+        self.command_queue = [{'comment': f"Initializing Machine {self.name}", 'style': 'machine'}]
+        self.max_feed = self.dict['Max Feed Rate (mm/min)']
+        self._x_offset = 0
+        self._y_offset = 0
+        self._z_offset = 0
+        self._tool = None
+        self._absolute = None
+        self._feed = None
+        self._css = 0
+        self._rpm = None
+        self._turtle = None
+        self._optimize = False
+        self._x = None
+        self._y = None
+        self._z = None
+        self._linear_moves = {None:[]}
+        self._optimize_tool = None
+        self._material = None
+        self._x_clear = None
+        self._y_clear = None
+        self._z_clear = None
+        self._fan_speed = None
+        self.gcode = None
         ap = argparse.ArgumentParser()
         ap.add_argument("-s", "--simulate", action='store_true', help="Simulate G-code in CAMotics")
         ap.add_argument("-l", "--load", action='store_true', help=f"Send G-code to {self.name} but do not execute")
@@ -91,7 +141,17 @@ class Machine:
 ################################################################################
 
     def queue(self, **kwargs):
+        # Callers on hot paths can pass comment_fmt=(fmt, *args) instead of
+        # a pre-built comment; the float formatting is then deferred to
+        # generate_gcode and only paid if the G-code is actually rendered
         self.command_queue.append(kwargs)
+
+    def queue_many(self, style, *comments):
+        # Batch form for runs of comment-only entries sharing a style:
+        # one call and one extend instead of a queue() per line
+        self.command_queue.extend(
+            {'comment': comment, 'style': style} for comment in comments
+        )
         
 ################################################################################
 # Tool Table House Keeping
@@ -99,13 +159,16 @@ class Machine:
 
     def tool_from_tool_table(self, i):
         if self._tool_table:
-            if str(i) in self._tool_table:
-                return Tool(self, self._tool_table[str(i)], str(i))
-            else:
-                for index in self._tool_table:
-                    if i in self._tool_table[str(index)]['description']:
-                        return Tool(self, self._tool_table[str(index)], str(index))
+            if isinstance(i, str) and i.isdigit():
+                i = int(i)
+            if isinstance(i, int):
+                if 0 <= i < len(self._tool_table):
+                    return Tool(self, self._tool_table[i], i)
                 raise ValueError(f"{RED}Tool {i} is not in the Tool Table{ENDC}")
+            for index, entry in enumerate(self._tool_table):
+                if i in entry['description']:
+                    return Tool(self, entry, index)
+            raise ValueError(f"{RED}Tool {i} is not in the Tool Table{ENDC}")
         else:
             raise ValueError(f"Must load Tool Table before using it")
 
@@ -147,9 +210,9 @@ class Machine:
                 self.rapid(x=position[0])
                 self.rapid(y=position[1])
             self.queue(code=f"M6 T{tool}", comment=f"Select Tool {tool}", style='machine')
+            self.queue(comment=f"End Tool Change", style='machine')
         else:
-            self.queue(comment=f"Select Tool {tool}", style='machine')
-        self.queue(comment=f"End Tool Change", style='machine')
+            self.queue_many('machine', f"Select Tool {tool}", "End Tool Change")
 
 ################################################################################
 # Tool Offsets
@@ -192,7 +255,9 @@ class Machine:
 
     @material.setter
     def material(self,value):
-        self._material = value
+        # Interned so feeds-and-speeds dict probes keyed on the material
+        # hit the pointer-identity fast path instead of a full strcmp
+        self._material = sys.intern(value) if isinstance(value, str) else value
         return self.material
 
 ################################################################################
@@ -237,7 +302,7 @@ class Machine:
         if value is None:
             raise ValueError(f"{RED}Machine.feed cannot be set to None")
         self._feed = value
-        self.queue(comment=f"Using Feed: {self.feed:.4f} mm/min | {self.feed/25.4:.4f} in/min | {self.feed/25.4/12:.4f} ft/min", style='machine')
+        self.queue(comment_fmt=("Using Feed: {:.4f} mm/min | {:.4f} in/min | {:.4f} ft/min", value, value/25.4, value/25.4/12), style='machine')
 
     @property
     def accel(self):
@@ -679,9 +744,13 @@ class Machine:
                 line += f" F{command['f']:.4f}"
             if command.get('s',None) is not None:       # Spindle RPM
                 line += f" S{command['s']:.4f}"
-            if command.get('comment',None) is not None: # Human-readable comments
-                #GRP line += f"; {styles[command.get('style', '')]}{command.get('comment', '')}{ENDC}"
-                line += f"; {command.get('comment', '')}"
+            comment = command.get('comment', None)
+            if comment is None and command.get('comment_fmt', None) is not None:
+                fmt = command['comment_fmt']    # Deferred comment formatting
+                comment = fmt[0].format(*fmt[1:])
+            if comment is not None:             # Human-readable comments
+                #GRP line += f"; {styles[command.get('style', '')]}{comment}{ENDC}"
+                line += f"; {comment}"
             self.gcode_array.append(line)
         self.gcode = "\n".join(self.gcode_array)
 
@@ -1,8 +1,10 @@
 import json
 import math
-from pathlib import Path
+import sys
 
-from .machine import Machine
+import numpy as np
+
+from .machine import Machine, _load_json, _MACHINES_DIR, _TABLES_DIR
 from .tool import Tool
 
 RED    = '\033[31m'
@@ -12,38 +14,109 @@ GREEN  = '\033[92m'
 CYAN   = '\033[36m'
 ENDC   = '\033[0m'
 
+_MPS_TO_FPM = 196.85  # m/s -> surface ft/min
+
 ################################################################################
 # Initializer -- Load details from JSON
 ################################################################################
 
 class Mill(Machine):
+
+    # Machine still carries a __dict__, so these slots trade a dict probe
+    # for a fixed-offset descriptor on the attributes the feeds-and-speeds
+    # hot path touches most
+    __slots__ = (
+        '_tool_table', '_tool_diam', '_tool_flutes', '_tool_cutter',
+        '_fas', '_sfm_index', '_chipload_idx', '_sfm_index_src',
+        '_rpm_by_tool', '_rpm_by_tool_cache',
+        '_tool_rpm_mid', '_tool_ipm_mid',
+        '_k_diameter', '_k_rpm_from_css', '_k_css_from_rpm',
+        'max_rpm', 'safe_z',
+    )
+
     def __init__(self, json_file):
         super().__init__(json_file)
         self.queue(comment='Loading Mill parameters from JSON', style='mill')
 
-        with open(f"machines/{json_file}") as f:
-            config = json.load(f)
+        config = _load_json(_MACHINES_DIR / json_file)
 
         if 'Tool Table' not in config:
             raise KeyError(f"{RED}Your machine configuration must reference a tool table file{ENDC}")
 
         # Load the new-style tool_inventory.json and flatten it
-        tool_table_path = Path("tables") / config['Tool Table']
-        with open(tool_table_path, 'r') as tt:
-            nested_tool_data = json.load(tt)
-
-        # Flatten the tool table to match the old layout
-        self._tool_table = {}
-        counter = 0
-        for tool_type, tools in nested_tool_data.items():
-            for tool in tools:
-                tool["type"] = tool_type  # preserve type in each tool entry
-                self._tool_table[str(counter)] = tool
-                counter += 1
+        tool_table_path = _TABLES_DIR / config['Tool Table']
+        nested_tool_data = _load_json(tool_table_path)
+
+        # Flatten the tool table to match the old layout in one C-level
+        # comprehension; the dict-merge both tags each entry with its
+        # type and copies it so the cached JSON data stays pristine.
+        # A plain list indexed by tool number avoids hashing a
+        # stringified id on every tool-table lookup.
+        self._tool_table = [
+            tool | {"type": tool_type}
+            for tool_type, tools in nested_tool_data.items()
+            for tool in tools
+        ]
+
+        # Structure-of-arrays view of the tool table: contiguous parallel
+        # arrays keep batch queries over many tools vectorizable instead
+        # of walking dict-of-dicts per tool
+        tools = self._tool_table
+        self._tool_diam = np.array([t.get('diameter', 0.0) for t in tools], dtype=np.float64)
+        self._tool_flutes = np.array([t.get('flutes', 0) for t in tools], dtype=np.int8)
+
+        # Feeds-and-speeds table loaded once per instance through the
+        # mtime-keyed cache; the indices are built lazily from it in
+        # _index_fas
+        self._fas = _load_json(_TABLES_DIR / 'feeds-and-speeds.json')
+        self._sfm_index = None
+        self._chipload_idx = None
+        self._sfm_index_src = None
+
+        # Mid-range SFM per tool for each cutter material, resolved once
+        # so the RPM matrix below is a pure array expression
+        self._tool_cutter = [
+            sys.intern(t.get('description', ',,,').split(',')[3].strip())
+            if t.get('description', '').count(',') >= 3 else None
+            for t in tools
+        ]
+        self._rpm_by_tool = None
+        self._rpm_by_tool_cache = {}
+
+        # Manufacturer rpm/ipm recommendations averaged once per tool at
+        # load; update_fas then reads a single float per material
+        self._tool_rpm_mid = [
+            {mat: (lo+hi)*0.5 for mat, (lo, hi) in t['rpm'].items()}
+            if t.get('rpm') else None for t in tools
+        ]
+        self._tool_ipm_mid = [
+            {mat: (lo+hi)*0.5 for mat, (lo, hi) in t['ipm'].items()}
+            if t.get('ipm') else None for t in tools
+        ]
+
+        # CSS<->RPM conversion factors for the current tool diameter; see
+        # _tool_constants
+        self._k_diameter = None
+        self._k_rpm_from_css = None
+        self._k_css_from_rpm = None
 
         self.max_rpm = config['Max Spindle RPM']
         self.safe_z = 10 #TODO: This should be in a Workpiece class
 
+################################################################################
+# CSS<->RPM Conversion Constants
+################################################################################
+
+    def _tool_constants(self):
+        # Refresh the cached conversion factors when the tool diameter
+        # changes; the css/rpm setters then multiply by a constant instead
+        # of re-dividing by pi and the diameter on every assignment
+        diameter = self.tool.diameter
+        if diameter != self._k_diameter:
+            self._k_rpm_from_css = 60000 / math.pi / diameter
+            self._k_css_from_rpm = math.pi * diameter / 60000
+            self._k_diameter = diameter
+
 ################################################################################
 # Constant Surface Speed
 ################################################################################
@@ -56,12 +129,17 @@ class Mill(Machine):
     def css(self, value):
         #self.queue(comment=f"Desired Constant Surface Speed (CSS): {value:.4f} m/s | {value*196.85:.4f} ft/min{ENDC}", style='mill')
         #self.queue(comment=f"Calculating RPM from CSS and tool diameter.", style='mill')
-        rpm = value * 60000 / math.pi / self.tool.diameter
+        self._tool_constants()
+        rpm = value * self._k_rpm_from_css
+        # Re-setting the same surface speed (common in CAM-generated
+        # programs) shouldn't re-emit the RPM comments
+        if self._rpm is not None and abs(min(rpm, self.max_rpm) - self._rpm) < 1e-6:
+            return
         if rpm > self.max_rpm:
-            css = self.max_rpm * math.pi * self.tool.diameter / 60000
-            self.queue(comment=f"{self.name} cannot do {rpm:.4f} rpm.  Maxing out at {self.max_rpm} rpm | {css:.4f} m/s | {css*196.85:.4f} ft/min", style='warning')
+            css = self.max_rpm * self._k_css_from_rpm
+            self.queue(comment_fmt=("{} cannot do {:.4f} rpm.  Maxing out at {} rpm | {:.4f} m/s | {:.4f} ft/min", self.name, rpm, self.max_rpm, css, css*_MPS_TO_FPM), style='warning')
             rpm = self.max_rpm;
-        self.queue(comment=f"Setting RPM: {rpm:.4f} | {rpm/60:.4f} Hz on the VFD", style='mill')
+        self.queue(comment_fmt=("Setting RPM: {:.4f} | {:.4f} Hz on the VFD", rpm, rpm/60), style='mill')
         self._rpm = rpm
 
     surface_speed = css
@@ -78,14 +156,19 @@ class Mill(Machine):
     def rpm(self, value):
         if value > self.max_rpm:
             raise ValueError(f"Machine.rpm ({value}) must be lower than Machine.max_rpm ({self.max_rpm})")
+        # Skip the queue emissions when the spindle speed isn't actually
+        # changing; tight loops re-assert the same RPM constantly
+        if self._rpm is not None and abs(value - self._rpm) < 1e-6:
+            return
         self._rpm = value
         self.queue(code='G97', comment='Constant Spindle Speed')
-        self.queue(code=f"S{value}", comment=f"Set Spindle RPM: {value:.4f}")
+        self.queue(code=f"S{value}", comment_fmt=("Set Spindle RPM: {:.4f}", value))
         if self.tool.diameter is not None:
-            css = self.rpm * math.pi * self.tool.diameter / 60000
+            self._tool_constants()
+            css = self.rpm * self._k_css_from_rpm
             if round(self._css, 4) != round(css, 4):
                 self._css = css
-                self.queue(comment=f"Calculated Tool Constant Surface Speed (CSS): {self.css:.4f} m/s | {self.css*196.85:.4f} ft/min", style='mill')
+                self.queue(comment_fmt=("Calculated Tool Constant Surface Speed (CSS): {:.4f} m/s | {:.4f} ft/min", css, css*_MPS_TO_FPM), style='mill')
         else:
             self.queue(comment='Cannot calculate CSS from RPM because tool diameter is undefined', style='warning')
 
@@ -93,34 +176,95 @@ class Mill(Machine):
 # Feeds and Speeds
 ################################################################################
 
+    @staticmethod
+    def _mid3(rng):
+        # Bake the mid-range average in as a third element; anything that
+        # isn't a [lo, hi] pair passes through untouched
+        if isinstance(rng, (list, tuple)) and len(rng) == 2:
+            return (rng[0], rng[1], (rng[0]+rng[1])*0.5)
+        return rng
+
+    def _index_fas(self):
+        # Flatten the nested SFM table into one dict keyed by
+        # (cutter, workpiece material), so each update_fas lookup is a
+        # single tuple-key probe instead of two chained dict accesses.
+        # Rebuilt only when the cached table object changes.
+        if self._sfm_index_src is not self._fas:
+            # Keys are interned so lookups against the (equally interned)
+            # machine material and cutter strings compare by pointer.
+            # The mid-range average is baked in as a third element so the
+            # hot path reads it instead of re-averaging per call.
+            self._sfm_index = {
+                (sys.intern(cutter), sys.intern(material)): self._mid3(sfm_range)
+                for cutter, materials in self._fas['SFM'].items()
+                for material, sfm_range in materials.items()
+            }
+            # Reindex the chipload tables by diameter in integer
+            # thousandths of an inch: int keys hash faster than strings
+            # and the lookup no longer formats a float per call
+            self._chipload_idx = {
+                sys.intern(material): {
+                    int(round(float(k)*1000)): self._mid3(v)
+                    for k, v in table.items()
+                }
+                for material, table in self._fas['Chipload'].items()
+            }
+            # The per-material RPM matrices are derived from the SFM
+            # index, so they go stale together
+            self._rpm_by_tool_cache.clear()
+            self._sfm_index_src = self._fas
+
+    def _precompute_fas_matrix(self, material):
+        # Vectorized mid-range spindle RPM for every tool in the table at
+        # once: one array expression instead of a Python loop per tool.
+        # Cached per workpiece material; entries are NaN where the SFM
+        # table has nothing for that cutter/material pair.
+        rpms = self._rpm_by_tool_cache.get(material)
+        if rpms is None:
+            sfm_mid = np.full(self._tool_diam.shape, np.nan)
+            for i, cutter in enumerate(self._tool_cutter):
+                sfm_range = self._sfm_index.get((cutter, material))
+                if isinstance(sfm_range, tuple):
+                    sfm_mid[i] = sfm_range[2]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rpms = sfm_mid * 12.0 / (np.pi * self._tool_diam)
+            self._rpm_by_tool_cache[material] = rpms
+        self._rpm_by_tool = rpms
+        return rpms
+
     def update_fas(self):
         if self.material and self.tool:
-            fas_file = 'tables/feeds-and-speeds.json'
-            with open(fas_file, 'r') as fas:
-                self._fas = json.load(fas)
-            sfm = self._fas['SFM']
-            chipload = self._fas['Chipload']
+            # Re-resolve through the mtime-keyed loader: a steady-state
+            # call costs one stat() and hands back the same parsed dict,
+            # while an edited table is reloaded and (via the identity
+            # guard in _index_fas) reindexed
+            self._fas = _load_json(_TABLES_DIR / 'feeds-and-speeds.json')
+            self._index_fas()
+            self._precompute_fas_matrix(self.material)
+            chipload = self._chipload_idx
             cutter = self.tool.material
-            if self.material in sfm[cutter] and self.material in chipload:
+            sfm_range = self._sfm_index.get((cutter, self.material))
+            if sfm_range is not None and self.material in chipload:
                 self.queue(comment=f"Workpiece is {self.material}", style='machine')
 
-                if self.tool.rpm:
-                    rpm = (self.tool.rpm[self.material][0]+self.tool.rpm[self.material][1])/2
-                    self.queue(comment=f"Using tool manufacturer recommended spindle RPM: {rpm:.4f} rpm", style='machine')
+                rpm_mid = self._tool_rpm_mid[self.tool.number]
+                if rpm_mid:
+                    rpm = rpm_mid[self.material]
+                    self.queue(comment_fmt=("Using tool manufacturer recommended spindle RPM: {:.4f} rpm", rpm), style='machine')
                     self.rpm = rpm
                 else:
-                    self.css = (sfm[cutter][self.material][0]+sfm[cutter][self.material][1])/2/196.85
+                    self.css = sfm_range[2]/_MPS_TO_FPM
 
-                if self.tool.ipm:
-                    ipm = (self.tool.ipm[self.material][0]+self.tool.ipm[self.material][1])/2
-                    self.queue(comment=f"Using tool manufacturer recommended feed: {ipm:.4f} in/min", style='machine')
+                ipm_mid = self._tool_ipm_mid[self.tool.number]
+                if ipm_mid:
+                    ipm = ipm_mid[self.material]
+                    self.queue(comment_fmt=("Using tool manufacturer recommended feed: {:.4f} in/min", ipm), style='machine')
                     self.feed = ipm*25.4
                 else:
                     self.queue(comment=f"No manufacturer-recommended IPM Feed.  Calculating.", style='machine')
-                    cl_range = chipload[self.material].get(f"{self.tool.diameter/25.4:.3f}", None)
+                    cl_range = chipload[self.material].get(int(round(self.tool.diameter/25.4*1000)), None)
                     if cl_range:
-                        cl_mean = (cl_range[0]+cl_range[1])/2
-                        self.feed = self.rpm * self.tool.flutes * cl_mean * 25.4
+                        self.feed = self.rpm * self.tool.flutes * cl_range[2] * 25.4
                     else:
                         self.queue(comment=f"Tool not available in chipload table.  You're on your own for feeds and speeds.", style='warning')
 
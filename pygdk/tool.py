@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 RED  = '\033[31m' # Red
@@ -13,7 +14,7 @@ class Tool:
 ################################################################################
 
     def __init__(self, machine, dict=base_dir / "tables/tools.json", i=None):
-        if dict and i:
+        if dict and i is not None:  # i is now an int index, and 0 is valid
             self._rpm = dict.get('rpm', None)
             self._ipm = dict.get('ipm', None)
             self._units = dict.get('units', None)
@@ -122,7 +123,8 @@ class Tool:
 
     @property
     def material(self):
-        return self._description.split(',')[3].strip()
+        # Interned to match the keys of the Mill feeds-and-speeds index
+        return sys.intern(self._description.split(',')[3].strip())
 
 ################################################################################
 # Tool.ipm -- Manufacturer-Recommended Inches-Per-Minute Feed
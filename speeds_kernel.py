@@ -0,0 +1,32 @@
+"""
+Batch RPM interpolation kernel for Opti-Mill.
+
+Provides a vectorized interpolator used by ToolCalculator for looking up
+RPM across an array of diameters in one call. When numba is installed
+the kernel is JIT-compiled to native code; otherwise it falls back to
+numpy.interp, which already vectorizes over the query array in C.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _interp_batch_numpy(diameters: np.ndarray, rpms: np.ndarray,
+                        queries: np.ndarray) -> np.ndarray:
+    """Interpolate RPM for each query diameter using numpy.interp."""
+    return np.interp(queries, diameters, rpms)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def interp_batch(diameters, rpms, queries):
+        out = np.empty_like(queries)
+        for i in range(queries.size):
+            out[i] = np.interp(queries[i], diameters, rpms)
+        return out
+else:
+    interp_batch = _interp_batch_numpy